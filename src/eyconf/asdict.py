@@ -3,9 +3,15 @@
 from __future__ import annotations
 
 import copy
+import datetime
+import decimal
+import enum
 import logging
+import pathlib
 import types
-from dataclasses import fields
+import uuid
+from collections.abc import Callable
+from dataclasses import Field, fields
 from functools import lru_cache
 from typing import (
     TYPE_CHECKING,
@@ -22,9 +28,19 @@ D = TypeVar("D", bound="DataclassInstance")
 
 
 @lru_cache(maxsize=256)
-def _type_has_aliases(cls: type) -> bool:
-    """Check if any field on *cls* carries an ``alias`` in its metadata."""
-    return any("alias" in f.metadata for f in fields(cls))
+def _field_info(
+    cls: type,
+) -> tuple[tuple[Field[Any], ...], tuple[tuple[str, str], ...]]:
+    """Get the fields of a dataclass type and their ``(name, key)`` pairs.
+
+    The key is the alias of the field if one is defined in the metadata,
+    otherwise the field name. Cached per type, as the fields of a
+    dataclass do not change after class creation.
+    """
+    obj_fields = fields(cls)
+    return obj_fields, tuple(
+        (f.name, f.metadata.get("alias", f.name)) for f in obj_fields
+    )
 
 
 def asdict_with_aliases(
@@ -39,18 +55,30 @@ def asdict_with_aliases(
     will use the alias as the key in the resulting dictionary (instead of the attribute name).
 
     This is pretty much a copy of the standard `dataclasses.asdict` function,
-    but we had to modify it, because the dict_factory needs to access obj recursively.
-    (previously dataclass obj not passed down)
+    but we had to modify it, because the keys depend on the fields of obj.
+    The alias lookup is cached per dataclass type.
     """
     if not hasattr(type(obj), "__dataclass_fields__"):
         raise TypeError("asdict_with_aliases() should be called on dataclass instances")
 
     return _asdict_inner(
         obj,
-        dict_factory=_alias_dict_factory,
         include_attributes=include_attributes,
         include_properties=include_properties,
-    )  # type: ignore[arg-type]
+    )
+
+
+@lru_cache(maxsize=256)
+def _property_names(cls: type) -> tuple[str, ...]:
+    """Get the names of all public properties of a dataclass type, except fields."""
+    field_names = cls.__dataclass_fields__  # type: ignore[attr-defined]
+    return tuple(
+        name
+        for name in dir(cls)
+        if not name.startswith("_")
+        and name not in field_names
+        and isinstance(getattr(cls, name, None), property)
+    )
 
 
 # -------------- Slightly modified copy from dataclasses.asdict -------------- #
@@ -78,61 +106,122 @@ _ATOMIC_TYPES = frozenset(
     }
 )
 
+# Immutable types (and their subclasses) which are returned as is
+# instead of falling back to a deepcopy
+_IMMUTABLE_TYPES = (
+    pathlib.PurePath,
+    enum.Enum,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    datetime.timezone,
+    uuid.UUID,
+    decimal.Decimal,
+)
+
+# Whether values of a type are returned as is, i.e. the type is atomic or
+# a subclass of an immutable type. Filled lazily for all other types and
+# reset once full, so dynamically created types are not kept alive forever.
+_ATOMIC_CACHE: dict[type, bool] = dict.fromkeys(_ATOMIC_TYPES, True)
+_ATOMIC_CACHE_MAXSIZE = 256
+
 
-def _asdict_inner(obj, **kwargs):
-    dict_factory = kwargs.get("dict_factory", dict)
-    include_attributes = kwargs.get("include_attributes", False)
-    include_properties = kwargs.get("include_properties", False)
+def _is_atomic_type(t: type) -> bool:
+    """Check (and cache) whether values of type *t* are returned as is."""
+    atomic = _ATOMIC_CACHE.get(t)
+    if atomic is None:
+        if len(_ATOMIC_CACHE) >= _ATOMIC_CACHE_MAXSIZE:
+            # Cleared in place, the generated builders hold its `get`
+            _ATOMIC_CACHE.clear()
+            _ATOMIC_CACHE.update(dict.fromkeys(_ATOMIC_TYPES, True))
+        atomic = _ATOMIC_CACHE[t] = issubclass(t, _IMMUTABLE_TYPES)
+    return atomic
 
-    if type(obj) in _ATOMIC_TYPES:
+
+@lru_cache(maxsize=256)
+def _dict_builder(cls: type) -> Callable[[Any, bool, bool], dict[str, Any]]:
+    """Generate a function converting an instance of a dataclass type to a dict.
+
+    The generated function reads all fields directly and uses the (aliased)
+    keys as literals. Atomic values are returned as is, all other values are
+    passed on to `_asdict_inner`. The `include_attributes` and
+    `include_properties` flags are only passed on by types with aliases,
+    values of types without aliases are converted without them.
+
+    For a dataclass with the fields `a` and `b` (alias `c`) this generates::
+
+        def __asdict(obj, attrs, props):
+            v0 = obj.a
+            v1 = obj.b
+            return {
+                'a': v0 if atomic(type(v0)) else inner(v0, attrs, props),
+                'c': v1 if atomic(type(v1)) else inner(v1, attrs, props),
+            }
+    """
+    obj_fields, name_keys = _field_info(cls)
+    has_aliases = any("alias" in f.metadata for f in obj_fields)
+    flags = "attrs, props" if has_aliases else "False, False"
+    lines = ["def __asdict(obj, attrs, props):"]
+    for i, (name, _) in enumerate(name_keys):
+        lines.append(f"    v{i} = obj.{name}")
+    lines.append("    return {")
+    for i, (_, key) in enumerate(name_keys):
+        lines.append(
+            f"        {key!r}: v{i} if atomic(type(v{i})) else inner(v{i}, {flags}),"
+        )
+    lines.append("    }")
+
+    namespace: dict[str, Any] = {
+        "atomic": _ATOMIC_CACHE.get,
+        "inner": _asdict_inner,
+    }
+    exec("\n".join(lines), namespace)
+    return namespace["__asdict"]
+
+
+def _asdict_inner(obj, include_attributes=False, include_properties=False):
+    if _is_atomic_type(type(obj)):
         return obj
     elif hasattr(type(obj), "__dataclass_fields__"):
-        # obj is dataclass — use the fast dict path unless aliases are present.
-        has_aliases = _type_has_aliases(type(obj))  # type: ignore[arg-type]
-        effective_factory = dict_factory if has_aliases else dict
-        obj_fields = fields(obj)
-
-        if effective_factory is dict:
-            result = {
-                f.name: _asdict_inner(getattr(obj, f.name), dict_factory=dict_factory)
-                for f in obj_fields
-            }
-        else:
-            _result = []
-            for f in obj_fields:
-                value = _asdict_inner(getattr(obj, f.name), **kwargs)
-                _result.append((f.name, value))
-            result = dict_factory(obj, _result)
-
-        field_names = {f.name for f in obj_fields}
+        # obj is dataclass, keys are resolved to aliases if present
+        builder = _dict_builder(type(obj))  # type: ignore[arg-type]
+        result = builder(obj, include_attributes, include_properties)
+
+        field_names = type(obj).__dataclass_fields__
         extra_attrs = {}
-        if include_attributes:
-            for k, v in obj.__dict__.items():
+        # Instances without a __dict__ (slots) or without more entries than
+        # fields cannot hold extra attributes, no need to walk them
+        attrs = getattr(obj, "__dict__", None)
+        if include_attributes and attrs and len(attrs) > len(field_names):
+            for k, v in attrs.items():
                 if not k.startswith("_") and k not in field_names:
-                    extra_attrs[k] = _asdict_inner(v, **kwargs)
+                    extra_attrs[k] = _asdict_inner(
+                        v, include_attributes, include_properties
+                    )
 
         if include_properties:
-            for prop in dir(obj):
-                if (
-                    not prop.startswith("_")
-                    and prop not in field_names
-                    and prop not in extra_attrs
-                ):
-                    attr = getattr(type(obj), prop, None)
-                    if isinstance(attr, property):
-                        try:
-                            extra_attrs[prop] = _asdict_inner(
-                                getattr(obj, prop), **kwargs
-                            )
-                        except Exception:
-                            pass  # Ignore property errors
-
-        # Merge. Can we be sure that result is a dict? Depends on factory.
-        if isinstance(result, dict):
-            result.update(extra_attrs)
+            for prop in _property_names(type(obj)):  # type: ignore[arg-type]
+                if prop not in extra_attrs:
+                    try:
+                        extra_attrs[prop] = _asdict_inner(
+                            getattr(obj, prop), include_attributes, include_properties
+                        )
+                    except Exception:
+                        pass  # Ignore property errors
 
+        if extra_attrs:
+            result.update(extra_attrs)
         return result
 
+    # Fast paths for the builtin containers, comprehensions are cheaper
+    # than passing a generator to the constructor of type(obj)
+    elif type(obj) is list:
+        return [_asdict_inner(v) for v in obj]
+    elif type(obj) is tuple:
+        return tuple([_asdict_inner(v) for v in obj])
+    elif type(obj) is dict:
+        return {_asdict_inner(k): _asdict_inner(v) for k, v in obj.items()}
+
     elif isinstance(obj, tuple) and hasattr(obj, "_fields"):
         # obj is a namedtuple.  Recurse into it, but the returned
         # object is another namedtuple of the same type.  This is
@@ -144,7 +233,7 @@ def _asdict_inner(obj, **kwargs):
         # I'm not using namedtuple's _asdict()
         # method, because:
         # - it does not recurse in to the namedtuple fields and
-        #   convert them to dicts (using dict_factory).
+        #   convert them to dicts.
         # - I don't actually want to return a dict here.  The main
         #   use case here is json.dumps, and it handles converting
         #   namedtuples to lists.  Admittedly we're losing some
@@ -153,45 +242,26 @@ def _asdict_inner(obj, **kwargs):
         #   namedtuples, we could no longer call asdict() on a data
         #   structure where a namedtuple was used as a dict key.
 
-        return type(obj)(*[_asdict_inner(v, dict_factory=dict_factory) for v in obj])
+        return type(obj)(*[_asdict_inner(v) for v in obj])
     elif isinstance(obj, (list, tuple)):
         # Assume we can create an object of this type by passing in a
         # generator (which is not true for namedtuples, handled
         # above).
-        return type(obj)(_asdict_inner(v, dict_factory=dict_factory) for v in obj)
+        return type(obj)(_asdict_inner(v) for v in obj)
     elif isinstance(obj, dict):
         if hasattr(type(obj), "default_factory"):
             # obj is a defaultdict, which has a different constructor from
             # dict as it requires the default_factory as its first arg.
             result = type(obj)(getattr(obj, "default_factory"))  # type: ignore
             for k, v in obj.items():
-                result[_asdict_inner(k, dict_factory=dict_factory)] = _asdict_inner(
-                    v, dict_factory=dict_factory
-                )
+                result[_asdict_inner(k)] = _asdict_inner(v)
             return result
         return type(obj)(
             (
-                _asdict_inner(k, dict_factory=dict_factory),
-                _asdict_inner(v, dict_factory=dict_factory),
+                _asdict_inner(k),
+                _asdict_inner(v),
             )
             for k, v in obj.items()
         )
     else:
         return copy.deepcopy(obj)
-
-
-def _alias_dict_factory(obj, items):
-    """Replace field names with their aliases.
-
-    Operates in O(N) by building a name→field lookup once per call instead
-    of scanning all fields for each key (O(N²)).
-    """
-    field_by_name = {f.name: f for f in fields(obj)}
-    result: dict[str, Any] = {}
-    for key, value in items:
-        f = field_by_name.get(key)
-        if f is not None and "alias" in f.metadata:
-            result[f.metadata["alias"]] = value
-        else:
-            result[key] = value
-    return result
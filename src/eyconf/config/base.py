@@ -6,9 +6,10 @@ with validation and serialization capabilities.
 
 from __future__ import annotations
 
+import io
 import logging
-from copy import deepcopy
-from dataclasses import asdict, is_dataclass
+from collections.abc import Iterator
+from dataclasses import asdict, fields, is_dataclass
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -23,7 +24,11 @@ from eyconf.type_utils import (
     is_dataclass_instance,
     is_dataclass_type,
 )
-from eyconf.utils import dataclass_from_dict, dict_items_resolve_aliases
+from eyconf.utils import (
+    _plain_fields,
+    dataclass_from_dict,
+    dict_items_resolve_aliases,
+)
 from eyconf.validation.backends import Validator, get_validator
 
 if TYPE_CHECKING:
@@ -85,10 +90,22 @@ class Config(Generic[D]):
 
         This applies an partial update to the existing configuration data.
         Only the provided keys will be updated, others will remain unchanged.
+        If the update fails, all changes made to the data are rolled back.
+        An empty update is a no-op.
         """
+        if not data:
+            return
+
+        # Previous values of all attributes set during the update as
+        # (target, attr_key, old_value). Replayed in reverse on failure, so
+        # we never need to copy the whole data tree.
+        undo: list[tuple[DataclassInstance, str, Any]] = []
+
+        def _set(target: DataclassInstance, key: str, value: Any):
+            undo.append((target, key, getattr(target, key)))
+            setattr(target, key, value)
 
         def _update(
-            target_type: type[DataclassInstance],
             target: DataclassInstance,
             update_data: dict[str, Any],
             path: list[tuple[DataclassInstance, str]] | None = None,
@@ -97,8 +114,6 @@ class Config(Generic[D]):
 
             Parameters
             ----------
-            target_type : type[DataclassInstance]
-                The dataclass type of the target instance.
             target : DataclassInstance
                 The dataclass instance to update.
             update_data : dict
@@ -109,27 +124,37 @@ class Config(Generic[D]):
                 [1] is attr key used to access the target from from its parent. E.g.
                 [(root_instance, "child_field"), (child_instance, "grandchild_field")]
             """
+            # Resolved from the instance, the annotation of a nested target
+            # may be a union (e.g. optional fields)
+            target_type = type(target)
             target_annotations = get_type_hints_resolve_namespace(target_type)
+            field_names = target_type.__dataclass_fields__
+            plain_fields = _plain_fields(target_type)
 
             for key, value in dict_items_resolve_aliases(update_data, target_type):
-                if hasattr(target, key):
+                # Membership test for schema fields, hasattr only for
+                # dynamic attributes set on the instance
+                if key in field_names or hasattr(target, key):
                     current_value = getattr(target, key)
 
                     # Handle dataclass fields
                     if is_dataclass_instance(current_value):
                         _update(
-                            target_annotations[key],
                             current_value,
                             value,
                             path=(path or []) + [(target, key)],
                         )
 
+                    # Plain typed fields, nothing to convert
+                    elif key in plain_fields and value is not None:
+                        _set(target, key, value)
+
                     # Handle Optional fields that were previously None
                     elif current_value is None and isinstance(value, dict):
                         nested_instance = dataclass_from_dict(
                             target_annotations[key], value
                         )
-                        setattr(target, key, nested_instance)
+                        _set(target, key, nested_instance)
                     elif current_annotation := target_annotations.get(key):
                         nested = dataclass_from_dict(
                             current_annotation,
@@ -138,12 +163,12 @@ class Config(Generic[D]):
                             # merge_dicts(asdict(current_value), value),  # type: ignore[arg-type]
                             value,
                         )
-                        setattr(target, key, nested)
+                        _set(target, key, nested)
                     else:
                         # Primitives and direct assignments
                         # Can only be reached if a dynamic field is added
                         # to the dataclass instance
-                        setattr(target, key, value)
+                        _set(target, key, value)
                 else:
                     # Non-schema fields
                     self._update_additional(
@@ -151,13 +176,12 @@ class Config(Generic[D]):
                         path=(path or []) + [(target, key)],
                     )
 
-        old_data = deepcopy(self._data)
-        _update(self._schema, self._data, data)
-
         try:
+            _update(self._data, data)
             self.validate()
         except Exception:
-            self._data = old_data
+            for target, key, old_value in reversed(undo):
+                setattr(target, key, old_value)
             raise
 
     def _update_additional(
@@ -183,6 +207,10 @@ class Config(Generic[D]):
 
         If the provided data is missing required fields, an error will be raised.
         """
+        if data is self._data:
+            # Nothing to construct, only re-validate the current data
+            self.validate()
+            return
         self._data = self._validator.validate_and_construct(data, self._schema)
 
     def reset(self):
@@ -215,19 +243,60 @@ class Config(Generic[D]):
 
     def __str__(self):
         """Return a custom formatted string representation of the configuration data."""
-        data_dict = asdict(self._data)
-        s = "\n".join(
-            "  " + line for line in self._pretty_format(data_dict).splitlines()
+        # Prefix every output line, so lines of multi-line values are indented too
+        return "\n".join(
+            "  " + line for line in self._pretty_format(self._data).splitlines()
         )
-        return s
-
-    def _pretty_format(self, data, indent=0):
-        """Format the dict with pretty indentation."""
-        result: list[str] = []
-        for key, value in data.items():
-            if isinstance(value, dict):
-                result.append(" " * indent + f"{key}:")
-                result.append(self._pretty_format(value, indent + 4))
+
+    def _pretty_format(self, data: dict | DataclassInstance, indent: int = 0) -> str:
+        """Format the dict or dataclass instance with pretty indentation.
+
+        Dataclass instances are walked directly, without converting them to
+        dicts first.
+        """
+        buf = io.StringIO()
+        # Stack of (items iterator, indent). Nested values are written right
+        # below their key, the parent continues once they are exhausted.
+        stack = [(_pretty_items(data), indent)]
+        while stack:
+            items, level = stack[-1]
+            for key, value in items:
+                if isinstance(value, dict) or is_dataclass_instance(value):
+                    buf.write(f"{' ' * level}{key}:\n")
+                    stack.append((_pretty_items(value), level + 4))
+                    break
+                if isinstance(value, (list, tuple)):
+                    # Printed as a whole, show contained dataclasses as dicts
+                    value = _pretty_value(value)
+                buf.write(f"{' ' * level}{key}: {value}\n")
             else:
-                result.append(" " * indent + f"{key}: {value}")
-        return "\n".join(result)
+                stack.pop()
+        return buf.getvalue().removesuffix("\n")
+
+
+def _pretty_value(value: Any) -> Any:
+    """Convert dataclasses nested (at any depth) in containers to dicts.
+
+    Mirrors the container handling of `dataclasses.asdict`.
+    """
+    if is_dataclass_instance(value):
+        return asdict(value)
+    if isinstance(value, tuple) and hasattr(value, "_fields"):
+        # namedtuples take their values as positional arguments
+        return type(value)(*[_pretty_value(v) for v in value])
+    if isinstance(value, (list, tuple)):
+        return type(value)(_pretty_value(v) for v in value)
+    if isinstance(value, dict):
+        if hasattr(type(value), "default_factory"):
+            result = type(value)(getattr(value, "default_factory"))
+            result.update((k, _pretty_value(v)) for k, v in value.items())
+            return result
+        return type(value)((k, _pretty_value(v)) for k, v in value.items())
+    return value
+
+
+def _pretty_items(data: dict | DataclassInstance) -> Iterator[tuple[Any, Any]]:
+    """Iterate the (key, value) pairs of a dict or the fields of a dataclass."""
+    if isinstance(data, dict):
+        return iter(data.items())
+    return ((f.name, getattr(data, f.name)) for f in fields(data))
@@ -3,19 +3,19 @@ from __future__ import annotations
 import logging
 from copy import deepcopy
 from dataclasses import is_dataclass
-from functools import cache
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from eyconf.asdict import asdict_with_aliases
 from eyconf.type_utils import (
-    is_dataclass_instance,
     is_dataclass_type,
     iter_dataclass_type,
 )
 from eyconf.utils import (
-    Metadata,
+    _alias_to_attr_key,
+    _attr_key_to_alias,
+    _copy_value,
     merge_dicts,
-    metadata_fields_from_dataclass,
 )
 from eyconf.validation.backends import get_validator
 
@@ -31,103 +31,192 @@ D = TypeVar("D", bound="DataclassInstance")
 log = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _mark_allow_additional(schema: type) -> None:
+    """Automatically set __allow_additional to True in the schema(s) if not set.
+
+    Only depends on the schema type, so this is done once per schema.
+    """
+    for s in iter_dataclass_type(schema):
+        if not hasattr(s, "__allow_additional"):
+            setattr(s, "__allow_additional", True)
+        else:
+            log.debug(
+                f"Schema {s.__name__} already has __allow_additional set to "
+                f"{getattr(s, '__allow_additional')}."
+            )
+
+
 class AccessProxy(Generic[D]):
     """Proxy to access attributes dynamically."""
 
+    __slots__ = ("_data", "_extra_data", "_parent", "_key", "_child_cache")
+
     _data: D  # this should never be an access proxy!
-    _extra_data: dict
+
+    # only set on the root proxy, nested proxies resolve
+    # their extra data via the parent (see `_get_extra_data`)
+    _extra_data: dict | None
 
     # this proxies' location in the overall config tree
     _parent: AccessProxy | None
+    _key: str | None  # dict key in the extra data of the parent
+
+    # proxies of nested dataclasses, by attribute key
+    _child_cache: dict[str, AccessProxy]
 
     def __init__(
         self,
         data: D,
-        extra_data: dict,
+        extra_data: dict | None,
         parent: AccessProxy | None = None,
+        key: str | None = None,
     ):
-        self._data = data
-        self._extra_data = extra_data
-        self._parent = parent
-
-    @property
-    @cache
-    def _fields_metadata(self) -> dict[str, Metadata]:
-        """Get the fields of the current dataclass schema."""
-        return metadata_fields_from_dataclass(self._data)
+        # Bypass the custom __setattr__, these are all internal slots
+        object.__setattr__(self, "_data", data)
+        object.__setattr__(self, "_extra_data", extra_data)
+        object.__setattr__(self, "_parent", parent)
+        object.__setattr__(self, "_key", key)
+        object.__setattr__(self, "_child_cache", {})
 
     def _resolve_attr_to_dict_key(self, attr_key: str) -> str:
         """Resolve an attribute key to its dict key using aliasing."""
-        return self._fields_metadata.get(attr_key, {}).get("alias", attr_key)
+        return _attr_key_to_alias(type(self._data)).get(attr_key, attr_key)
 
     def _resolve_dict_to_attr_key(self, dict_key: str) -> str:
         """Resolve a dict key to its attribute key using aliasing."""
-        for attr_key, metadata in self._fields_metadata.items():
-            if metadata.get("alias") == dict_key:
-                return attr_key
-        return dict_key
+        return _alias_to_attr_key(type(self._data)).get(dict_key, dict_key)
+
+    def _get_extra_data(self) -> dict | None:
+        """Get the extra data of this proxy, None if there is none yet.
+
+        Reading never creates extra data, so attribute access on nested
+        dataclasses does not leave empty dicts behind.
+        """
+        if self._parent is None:
+            return self._extra_data
+        parent_extra_data = self._parent._get_extra_data()
+        if parent_extra_data is None:
+            return None
+        return parent_extra_data.get(self._key)
+
+    def _ensure_extra_data(self) -> dict:
+        """Get the extra data of this proxy, creating it (and all parents) if needed."""
+        if self._parent is None:
+            assert self._extra_data is not None
+            return self._extra_data
+        return self._parent._ensure_extra_data().setdefault(self._key, {})
 
     def _to_dict(self) -> dict:
-        """Convert the AccessProxy to a standard dictionary."""
-        extra = deepcopy(self._extra_data)
-        data = deepcopy(asdict_with_aliases(self._data))
-        result = merge_dicts(data, extra)
-        return result
+        """Convert the AccessProxy to a standard dictionary.
+
+        The result never shares (mutable) objects with the proxy. The dict
+        from asdict_with_aliases is always fresh, only the extra data has to
+        be copied. This happens while merging, in a single pass.
+        """
+        data = asdict_with_aliases(self._data)
+        extra_data = self._get_extra_data()
+        if not extra_data:
+            # Common case, nothing to copy or merge
+            return data
+        return merge_dicts(data, extra_data, copy=True)
 
     def __getattr__(self, attr_key: str) -> Any:
         """Get field via attribute style access (non-aliased keys)."""
-        dict_key: str = self._resolve_attr_to_dict_key(attr_key)
+        if attr_key in AccessProxy.__slots__ or (
+            attr_key.startswith("__") and attr_key.endswith("__")
+        ):
+            # Unset internal slots (e.g. of a copy under construction) and
+            # dunder names (probed by copy, pickle, ...) are never resolved
+            raise AttributeError(attr_key)
         try:
             data = getattr(self._data, attr_key)
-            if is_dataclass_instance(data):
-                if dict_key not in self._extra_data:
-                    self._extra_data[dict_key] = dict()
-                return AccessProxy(
-                    data=data,
-                    extra_data=self._extra_data[dict_key],
-                    parent=self,
-                )
-            else:
-                return data
         except AttributeError:
-            return self._extra_data[dict_key]
+            dict_key = self._resolve_attr_to_dict_key(attr_key)
+            extra_data = self._get_extra_data() or {}
+            if attr_key.startswith("_") and dict_key not in extra_data:
+                # Missing private names (probed by IPython, ...) have to
+                # raise an AttributeError, not a KeyError
+                raise
+            return extra_data[dict_key]
+
+        if not hasattr(type(data), "__dataclass_fields__"):
+            # Plain values, the common case, need no alias resolution
+            return data
+
+        # Reuse the cached proxy as long as it still wraps
+        # the same dataclass instance
+        proxy = self._child_cache.get(attr_key)
+        if proxy is None or proxy._data is not data:
+            proxy = AccessProxy(
+                data=data,
+                extra_data=None,
+                parent=self,
+                key=self._resolve_attr_to_dict_key(attr_key),
+            )
+            self._child_cache[attr_key] = proxy
+        return proxy
 
     def __setattr__(self, attr_key: str, value: Any):
         """Set field via attribute style access (non-aliased keys)."""
+        if attr_key in AccessProxy.__slots__:
+            object.__setattr__(self, attr_key, value)
+            return
+
         if isinstance(value, AccessProxy):
             value = value._to_dict()
 
-        if attr_key.startswith("_"):
-            object.__setattr__(self, attr_key, value)
+        # Set lookup on the (fixed) fields first, hasattr calls getattr
+        # and catches an AttributeError for every extra field
+        if attr_key in type(self._data).__dataclass_fields__:
+            setattr(self._data, attr_key, value)
+            self._child_cache.pop(attr_key, None)
+        elif hasattr(self._data, attr_key):
+            # Other attributes of the dataclass, e.g. property setters
+            setattr(self._data, attr_key, value)
         else:
-            if hasattr(self._data, attr_key):
-                setattr(self._data, attr_key, value)
-            else:
-                dict_key = self._resolve_attr_to_dict_key(attr_key)
-                self._extra_data[dict_key] = value
+            dict_key = self._resolve_attr_to_dict_key(attr_key)
+            self._ensure_extra_data()[dict_key] = value
 
     def __getitem__(self, dict_key: str) -> Any:
         """Get field via dict style acces (alias)."""
         attr_key = self._resolve_dict_to_attr_key(dict_key)
-        if hasattr(self._data, attr_key):
+        # Same order as attribute access: fields, other attributes
+        # of the dataclass (e.g. properties), extra data
+        if attr_key in type(self._data).__dataclass_fields__ or hasattr(
+            self._data, attr_key
+        ):
             return self.__getattr__(attr_key)
-        else:
-            return self._extra_data[dict_key]
+        return (self._get_extra_data() or {})[dict_key]
 
     def __setitem__(self, dict_key: str, value: Any) -> None:
         """Set field via dict style access (alias)."""
         attr_key = self._resolve_dict_to_attr_key(dict_key)
-        if hasattr(self._data, attr_key):
+        if attr_key in type(self._data).__dataclass_fields__ or hasattr(
+            self._data, attr_key
+        ):
             self.__setattr__(attr_key, value)
         else:
-            self._extra_data[dict_key] = value
+            self._ensure_extra_data()[dict_key] = value
 
     def __deepcopy__(self, memo):
-        """Implement deepcopy to avoid issues with nested dataclasses."""
+        """Implement deepcopy to avoid issues with nested dataclasses.
+
+        The copy is detached from the parent and holds its own extra data.
+        """
+        source = self._get_extra_data()
+        if source is None:
+            extra_data = {}
+        elif id(source) in memo:
+            # Already copied, e.g. as `_extra_data` of a ConfigExtra
+            extra_data = memo[id(source)]
+        else:
+            # Register before copying, values may refer back to the dict
+            extra_data = memo[id(source)] = {}
+            extra_data.update((k, _copy_value(v, memo)) for k, v in source.items())
         new_proxy = type(self)(
             data=deepcopy(self._data, memo),
-            extra_data=deepcopy(self._extra_data, memo),
-            parent=self._parent,
+            extra_data=extra_data,
         )
         return new_proxy
 
@@ -181,15 +270,7 @@ class ConfigExtra(Config[D]):
                 )
             self._schema = type(data)
 
-        # Automatically set __allow_additional to True in the schema(s) if not set
-        for s in iter_dataclass_type(self._schema):
-            if not hasattr(s, "__allow_additional"):
-                setattr(s, "__allow_additional", True)
-            else:
-                log.debug(
-                    f"Schema {s.__name__} already has __allow_additional set to "
-                    f"{getattr(s, '__allow_additional')}."
-                )
+        _mark_allow_additional(self._schema)
 
         super().__init__(data, schema, get_validator(None, True))
         self._extra_data = dict()
@@ -198,6 +279,18 @@ class ConfigExtra(Config[D]):
             extra_data=self._extra_data,
         )
 
+    def overwrite(self, data: dict | D):
+        """Overwrite the configuration with provided data.
+
+        The cached access proxy is rebuilt if the schema data was replaced.
+        """
+        super().overwrite(data)
+        if self._access_proxy._data is not self._data:
+            self._access_proxy = AccessProxy(
+                data=self._data,
+                extra_data=self._extra_data,
+            )
+
     def reset(self):
         """Reset the configuration data to the default values."""
         super().reset()
@@ -235,10 +328,9 @@ class ConfigExtra(Config[D]):
 
     def to_dict(self, extra_fields: bool = True) -> dict:
         """Get the full configuration data as a dictionary, including extra fields."""
-        data = asdict_with_aliases(self.proxy._data)
         if extra_fields:
-            data = merge_dicts(data, self.proxy._extra_data)
-        return data
+            return self.proxy._to_dict()
+        return asdict_with_aliases(self._data)
 
     def _update_additional(
         self,
@@ -249,17 +341,14 @@ class ConfigExtra(Config[D]):
 
         Here, we update extra_data, which is a dict. So we use dict style.
         """
-        dict_key_path = []
-        for target, attr_key in path:
-            # resolve attr_key to dict_key using aliasing
-            field_metadata = metadata_fields_from_dataclass(target)
-            dict_key = field_metadata.get(attr_key, {}).get("alias", attr_key)
-            dict_key_path.append(dict_key)
+        # resolve attr_key to dict_key using aliasing
+        dict_key_path = [
+            _attr_key_to_alias(type(target)).get(attr_key, attr_key)
+            for target, attr_key in path
+        ]
 
         extra_data: dict[str, Any] = self._extra_data
         for dict_key in dict_key_path[:-1]:
-            if dict_key not in extra_data.keys():
-                extra_data[dict_key] = dict()
-            extra_data = extra_data[dict_key]
+            extra_data = extra_data.setdefault(dict_key, {})
 
         extra_data[dict_key_path[-1]] = value
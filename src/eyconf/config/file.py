@@ -6,17 +6,18 @@ on a dataclass schema.
 
 from __future__ import annotations
 
+import json
 import logging
 import os
 from dataclasses import is_dataclass
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
+    BinaryIO,
     TypeVar,
 )
 
-import yaml
-
 from eyconf.asdict import asdict_with_aliases
 from eyconf.generate_yaml import dataclass_to_yaml
 from eyconf.utils import (
@@ -35,6 +36,26 @@ D = TypeVar("D", bound="DataclassInstance")
 log = logging.getLogger(__name__)
 
 
+@cache
+def _yaml_loader() -> type:
+    """Return the yaml loader, the libyaml based one if pyyaml was built with it.
+
+    yaml is only imported on first use, in-memory configurations do not
+    need it.
+    """
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:  # pragma: no cover
+        from yaml import SafeLoader  # type: ignore[assignment]
+    return SafeLoader
+
+
+@lru_cache(maxsize=256)
+def _default_yaml(schema: type[DataclassInstance]) -> str:
+    """Return the default yaml for a schema, cached per schema type."""
+    return dataclass_to_yaml(schema)
+
+
 class EYConf(Config[D]):
     """Configuration class.
 
@@ -45,6 +66,7 @@ class EYConf(Config[D]):
     """
 
     path: Path
+    """Path of the configuration file, as returned by `get_file`."""
 
     def __init__(
         self,
@@ -107,7 +129,7 @@ class EYConf(Config[D]):
         You may overwrite this method to customize the default configuration
         generation.
         """
-        return dataclass_to_yaml(self._schema)
+        return _default_yaml(self._schema)
 
     def _write_default(self):
         """Generate default yaml configuration."""
@@ -117,33 +139,58 @@ class EYConf(Config[D]):
         yaml_str = self.default_yaml()
         os.makedirs(self.path.parent, exist_ok=True)
         with open(self.path, "w") as f:
-            f.write(yaml_str)
-            f.write("\n")  # Add a newline at the end of the file
+            # Single write, with a newline at the end of the file
+            f.write(yaml_str + "\n")
         log.info(f"Configuration file created at '{self.path.absolute()}'")
 
+    def _parse(self, file: BinaryIO) -> dict:
+        """Parse the contents of the (opened) configuration file.
+
+        JSON is a subset of yaml, but the json module parses it a lot faster.
+        For `.json` files we try it first and fall back to yaml, e.g. for the
+        generated defaults, which are always written as yaml.
+
+        Parsing from the file object keeps its name in yaml error messages.
+        """
+        if self.path.suffix == ".json":
+            try:
+                return json.load(file)
+            except ValueError:
+                file.seek(0)
+        # Same as yaml.load, with the lazily imported loader
+        loader = _yaml_loader()(file)
+        try:
+            return loader.get_single_data()
+        finally:
+            loader.dispose()
+
     def _load_as_dict_with_defaults(self) -> dict:
         """Load the configuration file and merge default values from schema."""
         log.info(f"Loading config file: {self.path.absolute()}")
 
-        if not self.path.exists():
+        # Opening directly saves a separate exists() check on every (re)load,
+        # the file is read in binary mode and decoded by the parser
+        try:
+            file = self.path.open("rb")
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Configuration file '{self.path.absolute()}' not found. Please generate"
                 " with `write_default()`."
-            )
-
-        # We load the schema first to allow for sane default merging
-        # -> Load defaults, then merge with file contents
-        try:
-            default_data: dict = asdict_with_aliases(self._schema())
-        except TypeError:
-            log.exception(
-                "Schema dataclass has required fields without defaults. Consider using "
-                "field with default_factory or default in your schema."
-            )
-            raise
+            ) from None
+
+        with file:
+            # We load the schema first to allow for sane default merging
+            # -> Load defaults, then merge with file contents
+            try:
+                default_data: dict = asdict_with_aliases(self._schema())
+            except TypeError:
+                log.exception(
+                    "Schema dataclass has required fields without defaults. Consider "
+                    "using field with default_factory or default in your schema."
+                )
+                raise
 
-        with open(self.path) as file:
             # TODO: Handle scanner errors
-            data = merge_dicts(default_data, yaml.safe_load(file), priority="b")
+            data = merge_dicts(default_data, self._parse(file), priority="b")
 
         return data
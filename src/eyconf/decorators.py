@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import functools
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import is_dataclass
 from typing import (
     TYPE_CHECKING,
@@ -13,7 +13,7 @@ from typing import (
 )
 
 from eyconf.type_utils import is_dataclass_type
-from eyconf.utils import get_metadata
+from eyconf.utils import _alias_to_attr_key, _attr_key_to_alias
 
 if TYPE_CHECKING:
     from _typeshed import DataclassInstance
@@ -37,39 +37,41 @@ class DictSetAccess(Protocol):
     def __setitem__(self, key: str, value: Any) -> None: ...  # noqa: D105
 
 
-def _aliases_map(cls: DataclassInstance) -> dict[str, str]:
-    """Get mapping of aliases to field names for a dataclass."""
-    return {m["alias"]: f.name for f, m in get_metadata(cls) if "alias" in m}
+def _aliases_map(cls: DataclassInstance) -> Mapping[str, str]:
+    """Get mapping of aliases to field names for a dataclass.
 
+    The mapping is cached per dataclass type and must not be mutated.
+    """
+    return _alias_to_attr_key(type(cls))
 
-def _get_attr_resolve_alias(self: DataclassInstance, key: str) -> Any:
-    """Get item resolving aliases."""
+
+def _resolve_alias(self: DataclassInstance, key: str) -> str:
+    """Resolve a subscript key (alias) to the attribute name of the field."""
     aliases = _aliases_map(self)
-    if key in aliases.keys():
-        return getattr(self, aliases[key])
-    elif key in aliases.values():
-        _suggestion = next((k for k, v in aliases.items() if v == key), None)
+    if not aliases:
+        return key
+    if key in aliases:
+        return aliases[key]
+
+    # Reverse lookup, attribute name to alias
+    names = _attr_key_to_alias(type(self))
+    if key in names:
         raise KeyError(
             "If an alias is defined, subscripting is only allowed "
-            + f"using the alias. Use ['{_suggestion}'] instead of ['{key}']!"
+            + f"using the alias. Use ['{names[key]}'] instead of ['{key}']!"
         )
 
-    return getattr(self, key)
+    return key
+
+
+def _get_attr_resolve_alias(self: DataclassInstance, key: str) -> Any:
+    """Get item resolving aliases."""
+    return getattr(self, _resolve_alias(self, key))
 
 
 def _set_attr_resolve_alias(self: DataclassInstance, key: str, value: Any) -> None:
     """Set item resolving aliases."""
-    aliases = _aliases_map(self)
-    if key in aliases.keys():
-        return setattr(self, aliases[key], value)
-    elif key in aliases.values():
-        _suggestion = next((k for k, v in aliases.items() if v == key), None)
-        raise KeyError(
-            "If an alias is defined, subscripting is only allowed "
-            + f"using the alias. Use ['{_suggestion}'] instead of ['{key}']!"
-        )
-
-    return setattr(self, key, value)
+    return setattr(self, _resolve_alias(self, key), value)
 
 
 @overload
@@ -33,8 +33,10 @@ if TYPE_CHECKING:
 class Line(ABC):
     """A line of yaml content."""
 
-    is_comment: bool = False
-    indent: int = 0
+    __slots__ = ("is_comment", "indent")
+
+    is_comment: bool
+    indent: int
 
     def __init__(self, is_comment: bool = False, indent: int = 0):
         self.is_comment = is_comment
@@ -55,6 +57,8 @@ class Line(ABC):
 class EmptyLine(Line):
     """An empty line of yaml content."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(is_comment=False, indent=0)
 
@@ -72,6 +76,8 @@ class EmptyLine(Line):
 class CommentLine(Line):
     """A comment line of yaml content."""
 
+    __slots__ = ("comment",)
+
     def __init__(self, comment: str, indent: int = 0):
         super().__init__(is_comment=True, indent=indent)
         self.comment = comment
@@ -85,6 +91,8 @@ class CommentLine(Line):
 class MapLine(Line):
     """A map line of yaml content."""
 
+    __slots__ = ("name", "default_value")
+
     name: str
     default_value: Primitives
 
@@ -107,6 +115,8 @@ class MapLine(Line):
 class SequenceLine(Line):
     """A sequence line of yaml content."""
 
+    __slots__ = ("default_value",)
+
     default_value: Primitives
 
     def __init__(self, default_value: Primitives, **kwargs):
@@ -122,6 +132,8 @@ class SequenceLine(Line):
 class SectionLine(Line):
     """A section line of yaml content."""
 
+    __slots__ = ("name",)
+
     name: str
 
     def __init__(self, name: str, **kwargs):
@@ -359,12 +371,22 @@ def __split_docstring(docstring: str, l=80, indent=0) -> list[Line]:
     return [CommentLine(line.strip(), indent=indent) for line in lines if line.strip()]
 
 
+# Matches the default docstring format of dataclasses
+_DEFAULT_DOCSTRING_PATTERN = re.compile(r"^[^\(]+\([^\)]*\)(\w*|.*)$")
+
+
 def __is_custom_docstring(dataclass_obj):
-    # Create a regex pattern to match the default docstring format
-    default_docstring_pattern = r"^[^\(]+\([^\)]*\)(\w*|.*)$"
+    # Dataclasses generate a single line `ClassName(field: type = ...)`
+    # docstring, which is recognized without running the regex
+    docstring: str = dataclass_obj.__doc__
+    name = (
+        dataclass_obj if isinstance(dataclass_obj, type) else type(dataclass_obj)
+    ).__name__
+    if docstring.startswith(name + "(") and ")" in docstring and "\n" not in docstring:
+        return False
 
     # Check if the docstring matches the default pattern
-    return re.match(default_docstring_pattern, dataclass_obj.__doc__) is None
+    return _DEFAULT_DOCSTRING_PATTERN.match(docstring) is None
 
 
 def __is_primitive_instance(t: Any) -> bool:
@@ -380,9 +402,7 @@ def __is_primitive_instance(t: Any) -> bool:
     bool
         True if the field type is a primitive instance, False otherwise.
     """
-    if isinstance(t, (*primitive_types,)):
-        return True
-    return False
+    return isinstance(t, primitive_types)
 
 
 def __is_dataclass_instance(t: Any) -> bool:
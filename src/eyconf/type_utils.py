@@ -5,7 +5,8 @@ import logging
 import sys
 from collections.abc import Iterator, Sequence
 from dataclasses import is_dataclass
-from types import UnionType
+from functools import lru_cache
+from types import ModuleType, UnionType
 from typing import (
     TYPE_CHECKING,
     Annotated,
@@ -28,7 +29,7 @@ D = TypeVar("D", bound="DataclassInstance")
 log = logging.getLogger(__name__)
 
 
-def get_type_hints_resolve_namespace(obj, include_extras: bool = False):
+def get_type_hints_resolve_namespace(obj, include_extras: bool = False) -> dict:
     """Get type hints for an object, resolving namespaces for dataclasses.
 
     Workaround for when using `from __future__ import annotations`.
@@ -37,7 +38,24 @@ def get_type_hints_resolve_namespace(obj, include_extras: bool = False):
     recursive resolution does not work on strings alone.
     To resolve types recursively in this case, the Dataclasses are needed
     and can be passed to `get_type_hints` via `globalns` and `localns`.
+
+    The hints are cached per type (or function) and a fresh dict is
+    returned on every call. Instances are resolved via their type and
+    bound methods via their function, so the cache does not grow per
+    instance.
     """
+    obj = getattr(obj, "__func__", obj)
+    if not isinstance(obj, (type, ModuleType)) and not callable(obj):
+        # Instances have the annotations of their class
+        obj = type(obj)
+    try:
+        hash(obj)
+    except TypeError:
+        return _get_type_hints(obj, include_extras)
+    return dict(_get_type_hints_cached(obj, include_extras))
+
+
+def _get_type_hints(obj, include_extras: bool) -> dict[str, Any]:
     try:
         return get_type_hints(obj, include_extras=include_extras)
     except NameError:
@@ -50,6 +68,9 @@ def get_type_hints_resolve_namespace(obj, include_extras: bool = False):
         )
 
 
+_get_type_hints_cached = lru_cache(maxsize=256)(_get_type_hints)
+
+
 def _get_namespace(
     obj,
 ) -> tuple[dict[str, Any], dict[str, Any]]:
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import builtins
 import logging
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
+from copy import deepcopy
 from dataclasses import Field, fields, is_dataclass
-from types import NoneType, UnionType
+from functools import lru_cache
+from types import MappingProxyType, NoneType, UnionType
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -12,9 +15,11 @@ from typing import (
     TypeVar,
     get_args,
     get_origin,
-    get_type_hints,
 )
 
+from eyconf.asdict import _ATOMIC_TYPES
+from eyconf.type_utils import get_type_hints_resolve_namespace
+
 if TYPE_CHECKING:
     from _typeshed import DataclassInstance
 
@@ -25,36 +30,52 @@ T = TypeVar("T")
 
 
 def merge_dicts(
-    a: dict, b: dict, path=[], priority: Literal["raise", "a", "b"] = "raise"
+    a: dict,
+    b: dict,
+    path=[],
+    priority: Literal["raise", "a", "b"] = "raise",
+    copy: bool = False,
 ) -> dict:
-    """Merge dict b into dict a, raising an exception on conflicts."""
-    # Convert path to tuple for faster concatenation
-    path_tuple = tuple(path)
-
-    for key in b:
-        val_b = b[key]
-        if key in a:
-            val_a = a[key]
-            # Handle nested dictionaries recursively
-            if isinstance(val_a, dict) and isinstance(val_b, dict):
-                merge_dicts(val_a, val_b, path_tuple + (str(key),), priority)
-            elif val_a != val_b:
-                # Handle conflicts based on priority
-                if priority == "a":
-                    # Keep a's value, ignore b's value
-                    continue
-                elif priority == "b":
-                    # Use b's value, overwriting a's value
-                    a[key] = val_b
-                else:
-                    full_path = ".".join(path_tuple + (str(key),))
-                    raise Exception(f"Conflict at {full_path}: {val_a} != {val_b}")
-        else:
-            a[key] = val_b
+    """Merge dict b into dict a, raising an exception on conflicts.
+
+    Values of b are inserted by reference, unless `copy` is set. Then
+    (non-atomic) values are deep copied while merging, so a never shares
+    mutable objects with b.
+    """
+    # Nested dictionaries are merged via an explicit stack of
+    # (target, source, path) entries instead of recursion
+    stack: list[tuple[dict, dict, tuple[str, ...]]] = [(a, b, tuple(path))]
+
+    while stack:
+        target, source, path_tuple = stack.pop()
+        for key, val_b in source.items():
+            if key in target:
+                val_a = target[key]
+                # Handle nested dictionaries
+                if isinstance(val_a, dict) and isinstance(val_b, dict):
+                    stack.append((val_a, val_b, path_tuple + (str(key),)))
+                elif val_a != val_b:
+                    # Handle conflicts based on priority
+                    if priority == "a":
+                        # Keep a's value, ignore b's value
+                        continue
+                    elif priority == "b":
+                        # Use b's value, overwriting a's value
+                        target[key] = _copy_value(val_b) if copy else val_b
+                    else:
+                        full_path = ".".join(path_tuple + (str(key),))
+                        raise Exception(f"Conflict at {full_path}: {val_a} != {val_b}")
+            else:
+                target[key] = _copy_value(val_b) if copy else val_b
 
     return a
 
 
+def _copy_value(value: Any, memo: dict | None = None) -> Any:
+    """Deep copy a value, atomic values are returned as is."""
+    return value if type(value) in _ATOMIC_TYPES else deepcopy(value, memo)
+
+
 def dataclass_from_dict(in_type: type[D], data: dict) -> D:
     """Convert a dict to a dataclass instance of the given type. Always returns a dataclass."""
     result = _dataclass_from_dict_inner(in_type, data)
@@ -64,83 +85,157 @@ def dataclass_from_dict(in_type: type[D], data: dict) -> D:
 
 
 def _dataclass_from_dict_inner(target_type: type, data: Any) -> Any:
-    """Inner function that handles Union types and may return None."""
-    # Handle Union types
+    """Convert data to the given type using its cached converter, may return None."""
+    convert = _converter(target_type)
+    return data if convert is None else convert(data)
+
+
+@lru_cache(maxsize=256)
+def _converter(target_type: Any) -> Callable[[Any], Any] | None:
+    """Return a converter for values of the given type, `None` for pass through.
+
+    Everything that only depends on the type is resolved once, so
+    converting a value only has to check the value itself:
+
+    - plain types pass values through,
+    - dataclasses build dicts with their generated `_from_dict_builder`,
+    - unions try the converters of their members in order,
+    - generic types convert the items of dicts, lists and tuples.
+    """
+    if isinstance(target_type, type) and get_origin(target_type) is None:
+        if not is_dataclass(target_type):
+            # Plain types, values are passed through as is
+            return None
+
+        def convert_dataclass(value: Any) -> Any:
+            # Looked up per call, allows for recursive schemas
+            if isinstance(value, dict):
+                return _from_dict_builder(target_type)(value)
+            return value
+
+        return convert_dataclass
+
     origin = get_origin(target_type)
     if origin is UnionType:
         args = get_args(target_type)
-        includes_none = any(arg is NoneType or arg is type(None) for arg in args)
-
-        if data is None and includes_none:
+        includes_none = NoneType in args
+        members = [_converter(arg) or _identity for arg in args if arg is not NoneType]
+
+        def convert_union(value: Any) -> Any:
+            if value is None and includes_none:
+                return None
+            # First member that converts without error wins
+            for convert in members:
+                try:
+                    return convert(value)
+                except (ValueError, TypeError, KeyError):
+                    continue
             return None
 
-        for arg in args:
-            if arg is NoneType or arg is type(None):
-                continue
-            try:
-                return _dataclass_from_dict_inner(arg, data)
-            except (ValueError, TypeError, KeyError):
-                continue
-        return None
+        return convert_union
 
-    # Handle dict data - convert to dataclass
-    if isinstance(data, dict) and is_dataclass(target_type):
-        field_types = get_type_hints(target_type, include_extras=False)
-        found_fields = {}
-        additional_fields = {}
-
-        aliased_fields = {}  # alias to name, only aliased fields
-        field_types_to_use = {}  # name to type, all fields
-        for f in fields(target_type):
-            if hasattr(f, "metadata"):
-                aliased_fields[f.metadata.get("alias")] = f.name
-            field_types_to_use[f.name] = field_types.get(f.name, f.type)
-
-        for key, value in data.items():
-            if key in aliased_fields.keys():
-                key = aliased_fields[key]
-                found_fields[key] = _dataclass_from_dict_inner(
-                    field_types_to_use[key], value
-                )
-            elif key in field_types_to_use.keys():
-                found_fields[key] = _dataclass_from_dict_inner(
-                    field_types_to_use[key], value
-                )
-            else:
-                additional_fields[key] = value
-
-        try:
-            res = target_type(**found_fields)  # type: ignore[bad-instantiation]
-            if len(additional_fields) > 0:
-                log.info(
-                    f"Additional fields {list(additional_fields.keys())} "
-                    f"found for dataclass {target_type.__name__} but "
-                    "not in schema and will be ignored."
-                )
+    args = get_args(target_type)
+    if not args:
+        return None
+    elem = _converter(args[0]) or _identity
+    value_conv = (_converter(args[1]) or _identity) if origin is dict else None
+
+    def convert_generic(value: Any) -> Any:
+        if value_conv is not None and isinstance(value, dict):
+            return {elem(k): value_conv(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [elem(item) for item in value]
+        return value
+
+    return convert_generic
+
+
+@lru_cache(maxsize=256)
+def _plain_fields(cls: type) -> frozenset[str]:
+    """Names of the fields of a dataclass type whose values need no conversion."""
+    field_types = get_type_hints_resolve_namespace(cls)
+    return frozenset(
+        name
+        for name, field_type in field_types.items()
+        if _converter(field_type) is None
+    )
+
+
+def _identity(value: T) -> T:
+    return value
+
+
+@lru_cache(maxsize=256)
+def _from_dict_builder(cls: type[D]) -> Callable[[dict], D]:
+    """Generate a function converting a dict to an instance of a dataclass type.
+
+    Field types and aliases are resolved once per type. Values of fields with
+    a plain (non generic, non dataclass) type are passed through as is, all
+    other values are converted with the precomputed `_converter` of the field
+    type. A field may be given by its name or its alias, the alias takes
+    precedence and only its value is converted.
+
+    For a dataclass with the fields `a: int` and `b: Nested` (alias `c`) this
+    generates::
+
+        def __from_dict(data):
+            kwargs = {}
+            if 'a' in data:
+                kwargs['a'] = data['a']
+            if 'c' in data:
+                kwargs['b'] = c1(data['c'])
+            elif 'b' in data:
+                kwargs['b'] = c1(data['b'])
+            try:
+                res = cls(**kwargs)
+            except TypeError as e:
+                raise ValueError(f"Failed to create {cls.__name__}: {e}")
+            if len(data) > len(kwargs):
+                log_additional(data)
             return res
-        except TypeError as e:
-            raise ValueError(f"Failed to create {target_type.__name__}: {e}")
-
-    # Potentially nested dataclass in dicts
-    if isinstance(data, dict) and get_origin(target_type) is dict:
-        key_type, value_type = get_args(target_type)
-        return {
-            _dataclass_from_dict_inner(key_type, k): _dataclass_from_dict_inner(
-                value_type, v
-            )
-            for k, v in data.items()
-        }
-
-    # Handle sequence types (list, tuple)
-    if isinstance(data, (list, tuple)):
-        if hasattr(target_type, "__args__") and target_type.__args__:
-            elem_type = target_type.__args__[0]
-            return [_dataclass_from_dict_inner(elem_type, item) for item in data]
+    """
+    field_types = get_type_hints_resolve_namespace(cls)
+    known_keys: set[str] = set()
+    namespace: dict[str, Any] = {"cls": cls}
+
+    lines = ["def __from_dict(data):", "    kwargs = {}"]
+    for i, f in enumerate(fields(cls)):
+        convert = _converter(field_types.get(f.name, f.type))
+        if convert is None:
+            value = "data[{key!r}]"
         else:
-            return data
+            namespace[f"c{i}"] = convert
+            value = f"c{i}(data[{{key!r}}])"
+
+        keys = [f.name]
+        if (alias := f.metadata.get("alias")) is not None:
+            keys.insert(0, alias)
+        for j, key in enumerate(keys):
+            known_keys.add(key)
+            lines.append(f"    {'elif' if j else 'if'} {key!r} in data:")
+            lines.append(f"        kwargs[{f.name!r}] = " + value.format(key=key))
+
+    def log_additional(data: dict) -> None:
+        additional_fields = [k for k in data if k not in known_keys]
+        if len(additional_fields) > 0:
+            log.info(
+                f"Additional fields {additional_fields} "
+                f"found for dataclass {cls.__name__} but "
+                "not in schema and will be ignored."
+            )
 
-    # Handle primitive types
-    return data
+    namespace["log_additional"] = log_additional
+    lines += [
+        "    try:",
+        "        res = cls(**kwargs)",
+        "    except TypeError as e:",
+        '        raise ValueError(f"Failed to create {cls.__name__}: {e}")',
+        "    if len(data) > len(kwargs):",
+        "        log_additional(data)",
+        "    return res",
+    ]
+    exec("\n".join(lines), namespace)
+    return namespace["__from_dict"]
 
 
 class Metadata(TypedDict, total=False):
@@ -169,6 +264,22 @@ def metadata_fields_from_dataclass(
     return {f.name: m for f, m in get_metadata(type)}
 
 
+@lru_cache(maxsize=256)
+def _alias_to_attr_key(cls: type) -> MappingProxyType[str, str]:
+    """Map the aliases of a dataclass type to field names, cached per type."""
+    return MappingProxyType(
+        {m["alias"]: f.name for f, m in get_metadata(cls) if "alias" in m}
+    )
+
+
+@lru_cache(maxsize=256)
+def _attr_key_to_alias(cls: type) -> MappingProxyType[str, str]:
+    """Map the field names of a dataclass type to aliases, cached per type."""
+    return MappingProxyType(
+        {name: alias for alias, name in _alias_to_attr_key(cls).items()}
+    )
+
+
 def dict_items_resolve_aliases(
     data: dict[str, T],
     type: type | DataclassInstance,
@@ -180,7 +291,10 @@ def dict_items_resolve_aliases(
 
     This resolve to attribute style keys (alias->non-alias).
     """
-    dict_key_to_attr_key = {
-        m["alias"]: f.name for f, m in get_metadata(type) if "alias" in m
-    }
+    dict_key_to_attr_key = _alias_to_attr_key(
+        type if isinstance(type, builtins.type) else type.__class__
+    )
+    if not dict_key_to_attr_key:
+        # Most schemas have no aliases, nothing to resolve
+        return data.items()
     return ((dict_key_to_attr_key.get(key, key), value) for key, value in data.items())
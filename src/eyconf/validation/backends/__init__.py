@@ -23,14 +23,14 @@ def _get_default_validator(allow_additional: bool = False) -> Validator:
     try:
         from .pydantic import PydanticValidator
 
-        return PydanticValidator()
+        return PydanticValidator(allow_additional)
     except ImportError:
         pass
 
     try:
         from .json_schema import JsonSchemaValidator
 
-        return JsonSchemaValidator()
+        return JsonSchemaValidator(allow_additional)
     except ImportError:
         pass
 
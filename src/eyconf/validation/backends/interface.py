@@ -2,7 +2,6 @@
 
 from abc import abstractmethod
 from dataclasses import is_dataclass
-from functools import cache
 from typing import TYPE_CHECKING, Any, Protocol, TypeVar, runtime_checkable
 
 from eyconf.utils import dataclass_from_dict
@@ -23,7 +22,6 @@ class Validator(Protocol[D]):
     generation, validation, instantiation, and instance checks.
     """
 
-    @cache
     @abstractmethod
     def to_json_schema(self, schema: type[D]) -> JsonSchema:
         """Generate JSON Schema from dataclass type.
@@ -43,7 +41,10 @@ class Validator(Protocol[D]):
         ValueError
             If schema is invalid or unsupported by backend.
 
-
+        Notes
+        -----
+        Backends are expected to cache the result per schema, callers must
+        not modify the returned dictionary.
         """
         ...
 
@@ -107,6 +108,7 @@ class Validator(Protocol[D]):
 
         """
         self.validate(data, schema)
-        if is_dataclass(data):
+        # Dicts are the common case (files, updates), check them first
+        if type(data) is not dict and is_dataclass(data):
             return data
         return dataclass_from_dict(schema, data)
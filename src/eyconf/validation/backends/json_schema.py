@@ -1,6 +1,7 @@
 import json
 import logging
 from collections.abc import Sequence
+from copy import deepcopy
 from dataclasses import MISSING, fields, is_dataclass
 from functools import cache
 from types import NoneType, UnionType
@@ -48,7 +49,6 @@ class JsonSchemaValidator(Validator[D]):
     def __init__(self, allow_additional: bool = False) -> None:
         self.allow_additional = allow_additional
 
-    @cache
     def to_json_schema(
         self,
         schema: type[D],
@@ -79,33 +79,65 @@ class JsonSchemaValidator(Validator[D]):
 
         Notes
         -----
-        Cached for repeated calls.
+        Cached per schema and `allow_additional` setting, the cache is shared
+        by all validator instances. Treat the returned schema as read-only.
         """
-        json_schema, _ = self._build_schema(schema)
+        return self._cached_json_schema(schema, self.allow_additional, check_schema)
+
+    @classmethod
+    @cache
+    def _cached_json_schema(
+        cls,
+        schema: type[D],
+        allow_additional: bool,
+        check_schema: bool,
+    ) -> JsonSchema:
+        json_schema, _ = cls(allow_additional)._build_schema(schema)
         if check_schema:
             Draft202012Validator.check_schema(json_schema)
 
         return json_schema
 
+    def _compiled_validator(self, schema: type[D]) -> Draft202012Validator:
+        """Return a compiled validator for the given dataclass type.
+
+        Cached, so the schema is only built, relaxed for `null` values and
+        compiled once per dataclass type. Works on a copy, the result of
+        `to_json_schema` is not modified.
+        """
+        return self._cached_validator(schema, self.allow_additional)
+
+    @classmethod
+    @cache
+    def _cached_validator(
+        cls, schema: type[D], allow_additional: bool
+    ) -> Draft202012Validator:
+        validator = cls(allow_additional)
+        json_schema = validator._allow_none_in_schema(
+            deepcopy(validator.to_json_schema(schema))
+        )
+        return Draft202012Validator(json_schema)  # type: ignore[bad-instantiation]
+
     def validate(self, data: D | dict[str, Any], schema: type[D]) -> None:
         """**Protocol match**: Validate data against schema-derived JSON Schema."""
         if is_dataclass_type(schema):
-            json_schema = self.to_json_schema(schema)
+            validator = self._compiled_validator(schema)
         else:
-            json_schema = cast(JsonSchema, schema)
+            json_schema = self._allow_none_in_schema(cast(JsonSchema, schema))
+            validator = Draft202012Validator(json_schema)  # type: ignore[bad-instantiation]
         if is_dataclass(data):
             data = asdict_with_aliases(data)
-        self._validate_dict(data, json_schema)
-
-    def _validate_dict(self, data: dict[str, Any], json_schema: JsonSchema):
-        schema = self._allow_none_in_schema(json_schema)
-        validator = Draft202012Validator(schema)  # type: ignore[bad-instantiation]
+        self._validate_dict(data, validator)
 
+    def _validate_dict(self, data: dict[str, Any], validator: Draft202012Validator):
         errors = list(validator.iter_errors(data))
         if errors:
             log.error("Validation errors in configuration data!")
-            log.debug(f"Data: {json.dumps(data, indent=2)}")
-            log.debug(f"Schema: {json.dumps(schema, indent=2)}")
+            # Dumping the data and the full schema is expensive, only do it
+            # if the debug output is actually emitted
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug(f"Data: {json.dumps(data, indent=2, default=str)}")
+                log.debug(f"Schema: {json.dumps(validator.schema, indent=2)}")
             raise to_ConfigurationError(errors)
 
     def _allow_none_in_schema(
@@ -83,7 +83,6 @@ class PydanticValidator(Validator[D]):
         """
         return TypeAdapter(schema)
 
-    @cache
     def to_json_schema(self, schema: type[D], check_schema: bool = True) -> JsonSchema:
         """Generate a JSON Schema for the given dataclass type.
 
@@ -98,9 +97,19 @@ class PydanticValidator(Validator[D]):
         -------
         JsonSchema
             JSON Schema dictionary representing the type.
+
+        Notes
+        -----
+        Cached per schema and ``allow_additional`` setting, the cache is shared
+        by all validator instances. Treat the returned schema as read-only.
         """
-        self._configure_types(schema, self.allow_additional)
-        return self._adapter(schema, self.allow_additional).json_schema(
+        return self._json_schema(schema, self.allow_additional)
+
+    @classmethod
+    @cache
+    def _json_schema(cls, schema: type[D], allow_additional: bool) -> JsonSchema:
+        cls._configure_types(schema, allow_additional)
+        return cls._adapter(schema, allow_additional).json_schema(
             schema_generator=CustomGenerateJsonSchema,
         )
 
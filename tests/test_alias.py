@@ -81,6 +81,29 @@ class TestAlias:
         nested_dump = asdict_with_aliases(nested_config)
         assert nested_dump["nested"]["dict_field"] == 43
 
+    def test_utils_alias_not_identifier(self):
+        @dataclass
+        class OddAliasConfig:
+            quote: int = field(default=1, metadata={"alias": 'it\'s "odd"'})
+            dash: int = field(default=2, metadata={"alias": "some-key"})
+
+        dump = asdict_with_aliases(OddAliasConfig())
+        assert dump == {'it\'s "odd"': 1, "some-key": 2}
+
+    def test_utils_collections(self):
+        @dataclass
+        class ListAliasConfig:
+            items: list[AliasConfig] = field(
+                default_factory=lambda: [AliasConfig(attr_field=1)]
+            )
+            mapping: dict[str, AliasConfig] = field(
+                default_factory=lambda: {"a": AliasConfig(attr_field=2)}
+            )
+
+        dump = asdict_with_aliases(ListAliasConfig())
+        assert dump["items"] == [{"dict_field": 1, "str_field": "FortyTwo!"}]
+        assert dump["mapping"] == {"a": {"dict_field": 2, "str_field": "FortyTwo!"}}
+
     def test_validate(self, validator):
         config = AliasConfig(attr_field=42)
 
@@ -104,6 +127,14 @@ class TestAlias:
 
         validator.validate(config, schema=AliasConfigAdditional)
 
+    def test_dict_access(self):
+        config = AliasDictConfig(attr_field=42)
+
+        assert config["dict_field"] == 42  # type: ignore[index]
+        assert config["str_field"] == "FortyTwo!"  # type: ignore[index]
+        with pytest.raises(KeyError, match="dict_field"):
+            config["attr_field"]  # type: ignore[index]
+
     def test_dict_alias_update(self):
         config = Config(AliasConfig(attr_field=42))
 
@@ -133,7 +164,7 @@ class TestAlias:
 
         config.proxy.import_.new_field = "New Value"
         assert config.proxy.import_.new_field == "New Value"
-        assert config.proxy._extra_data["import"]["new_field"] == "New Value"
+        assert config.proxy._extra_data["import"]["new_field"] == "New Value"  # type: ignore[index]
         assert config._extra_data["import"]["new_field"] == "New Value"
         assert config.proxy["import"].new_field == "New Value"
         assert config.proxy["import"]["new_field"] == "New Value"
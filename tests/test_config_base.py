@@ -211,11 +211,48 @@ class TestUpdate:
         assert conf_nested.data.other_field == "Hello, World!"
         assert conf_nested.data.nested_optional is None
 
+    def test_nested_optional_set(self, conf_nested: Config[ConfigNested]) -> None:
+        conf_nested.update({"nested_optional": {"int_field": 1}})
+        # Update the now existing optional dataclass in place
+        conf_nested.update({"nested_optional": {"str_field": "Updated!"}})
+        assert conf_nested.data.nested_optional == Config42(1, "Updated!")
+
+    def test_empty(self, conf42: Config[Config42]) -> None:
+        data = conf42.data
+        conf42.update({})
+        assert conf42.data is data
+        assert conf42.data == Config42()
+
     def test_invalid(self, conf42: Config[Config42]) -> None:
         with pytest.raises((MultiConfigurationError, ConfigurationError)):
             conf42.update({"int_field": "not an int"})
         assert conf42.data.int_field == 42
 
+    def test_invalid_nested_rollback(self, conf_nested: Config[ConfigNested]) -> None:
+        data = conf_nested.data
+        nested = data.nested
+        with pytest.raises((MultiConfigurationError, ConfigurationError)):
+            conf_nested.update(
+                {
+                    "nested": {"int_field": 100, "str_field": 1},
+                    "nested_optional": {"int_field": 200},
+                    "other_field": "Updated parent value!",
+                }
+            )
+        assert conf_nested.data is data
+        assert conf_nested.data.nested is nested
+        assert conf_nested.data == ConfigNested()
+
+        with pytest.raises(AttributeError):
+            conf_nested.update({"nested": {"int_field": 100, "new_field": "new"}})
+        assert conf_nested.data == ConfigNested()
+
+    def test_nested_dynamic_attribute(self, conf_nested: Config[ConfigNested]) -> None:
+        """Dynamic attributes on nested dataclasses are not validated."""
+        conf_nested.data.nested.dyn = "x"  # type: ignore[attr-defined]
+        conf_nested.update({"other_field": "Updated"})
+        assert conf_nested.data.other_field == "Updated"
+
     def test_update_additional(self, conf_nested: Config[ConfigNested]) -> None:
         with pytest.raises(AttributeError, match="Cannot set non-schema field"):
             conf_nested.update({"int_field": 100, "new_field": "I am new!"})
@@ -255,6 +292,15 @@ class TestOverwrite:
         with pytest.raises((MultiConfigurationError, ConfigurationError)):
             conf42.overwrite({"int_field": "not an int", "str_field": "Valid str"})
 
+    def test_revalidate_current(self, conf42: Config[Config42]) -> None:
+        data = conf42.data
+        conf42.overwrite(data)
+        assert conf42.data is data
+
+        data.int_field = "not an int"  # type: ignore[assignment]
+        with pytest.raises((MultiConfigurationError, ConfigurationError)):
+            conf42.overwrite(data)
+
     def test_nested(self, conf_nested: Config[ConfigNested]) -> None:
         conf_nested.overwrite(
             {
@@ -326,6 +372,45 @@ class TestPrintingUtils:
         assert "    int_field: 42" in str_output
         assert "  other_field: Hello, World!" in str_output
 
+    def test_str_nested_order(self, conf_nested: Config[ConfigNested]) -> None:
+        """Nested values are printed directly below their key."""
+        assert str(conf_nested) == (
+            "  nested:\n"
+            "      int_field: 42\n"
+            "      str_field: FortyTwo!\n"
+            "  nested_optional: None\n"
+            "  other_field: Hello, World!"
+        )
+
+    def test_str_multiline_value(self) -> None:
+        @dataclass
+        class MultilineConfig:
+            s: str = "a\nb"
+
+        assert str(Config(MultilineConfig())) == "  s: a\n  b"
+
+    def test_str_dataclass_list(self) -> None:
+        @dataclass
+        class ListConfig:
+            items: list[Config42] = field(default_factory=lambda: [Config42()])
+            mapping: dict[str, Config42] = field(
+                default_factory=lambda: {"a": Config42()}
+            )
+            nested: list[list[Config42]] = field(default_factory=lambda: [[Config42()]])
+            mappings: list[dict[str, Config42]] = field(
+                default_factory=lambda: [{"b": Config42()}]
+            )
+
+        assert str(Config(ListConfig())) == (
+            "  items: [{'int_field': 42, 'str_field': 'FortyTwo!'}]\n"
+            "  mapping:\n"
+            "      a:\n"
+            "          int_field: 42\n"
+            "          str_field: FortyTwo!\n"
+            "  nested: [[{'int_field': 42, 'str_field': 'FortyTwo!'}]]\n"
+            "  mappings: [{'b': {'int_field': 42, 'str_field': 'FortyTwo!'}}]"
+        )
+
     def test_repr_includes_object_info_and_data(self, conf42: Config[Config42]) -> None:
         """Test that __repr__ includes basic object info and formatted data."""
         repr_str = repr(conf42)
@@ -1,4 +1,4 @@
-from copy import deepcopy
+from copy import copy, deepcopy
 from dataclasses import dataclass, field
 from typing import Any
 import pytest
@@ -51,6 +51,19 @@ class TestDataProperties:
         assert conf42.proxy["new_field"] == "New Value"
         assert conf42.proxy.new_field == "New Value"
 
+    def test_deepcopy_keeps_extra_data_shared(self, conf42: ConfigExtra[Config42]):
+        conf42.proxy.new_field = {"nested": [1, 2]}
+
+        conf_copy = deepcopy(conf42)
+        assert conf_copy._extra_data is conf_copy.proxy._extra_data
+        assert conf_copy._extra_data is not conf42._extra_data
+        assert conf_copy._extra_data == conf42._extra_data
+
+        conf_copy.data.other_field = 5  # type: ignore[attr-defined]
+        assert conf_copy.extra_data["other_field"] == 5
+        assert conf_copy.to_dict()["other_field"] == 5
+        assert "other_field" not in conf42.extra_data
+
 
 class TestUpdate:
     def test_unknown_field(self):
@@ -168,6 +181,17 @@ class TestToDict:
         }
         assert result_no_extra == expected_no_extra
 
+    def test_to_dict_is_fresh(self, conf42: ConfigExtra[Config42]):
+        conf42.proxy.new_field = {"nested": [1, 2]}
+
+        result = conf42.to_dict()
+        result["new_field"]["nested"].append(3)
+        result["int_field"] = 0
+
+        assert conf42.to_dict()["new_field"] == {"nested": [1, 2]}
+        assert conf42.proxy._to_dict()["new_field"] == {"nested": [1, 2]}
+        assert conf42.to_dict()["int_field"] == 42
+
 
 class TestAccessProxy:
     @pytest.fixture
@@ -188,6 +212,25 @@ class TestAccessProxy:
         assert proxy._data.int_field == 100
         assert proxy._extra_data["new_field"] == "baz"
 
+    def test_attribute_assignment_property(self):
+        @dataclass
+        class PropertyConfig(Config42):
+            @property
+            def tenfold(self) -> int:
+                return self.int_field * 10
+
+            @tenfold.setter
+            def tenfold(self, value: int) -> None:
+                self.int_field = value // 10
+
+        extra_data: dict[str, Any] = dict()
+        proxy = AccessProxy(PropertyConfig(), extra_data)
+        proxy.tenfold = 50
+
+        assert proxy.tenfold == 50
+        assert proxy.int_field == 5
+        assert extra_data == {}
+
     @pytest.mark.skip(reason="Changed design, no longer using attribute dicts")
     def test_attribute_assignment_nested(self, proxy):
         proxy.nested.level = 42
@@ -217,6 +260,42 @@ class TestAccessProxy:
             },
         }
 
+    def test_nested_proxy_cached(self):
+        @dataclass
+        class NestedConfig:
+            nested_42: Config42 = field(default_factory=Config42)
+
+        proxy = AccessProxy(NestedConfig(), {})
+        nested = proxy.nested_42
+        assert isinstance(nested, AccessProxy)
+        assert proxy.nested_42 is nested
+
+        # Replacing the dataclass must not return a stale proxy
+        proxy.nested_42 = Config42(int_field=7)
+        assert proxy.nested_42 is not nested
+        assert proxy.nested_42.int_field == 7
+
+        proxy._data.nested_42 = Config42(int_field=8)
+        assert proxy.nested_42.int_field == 8
+
+    def test_nested_read_does_not_create_extra_data(self):
+        @dataclass
+        class NestedConfig:
+            nested_42: Config42 = field(default_factory=Config42)
+
+        extra_data: dict[str, Any] = dict()
+        proxy = AccessProxy(NestedConfig(), extra_data)
+        assert proxy.nested_42.int_field == 42
+        assert proxy.nested_42._parent is proxy
+        assert extra_data == {}
+
+        with pytest.raises(KeyError):
+            proxy.nested_42.unknown
+
+        proxy.nested_42.new_field = "New Value"
+        assert extra_data == {"nested_42": {"new_field": "New Value"}}
+        assert proxy.nested_42.new_field == "New Value"
+
     def test_item_assignment(self, proxy):
         proxy["int_field"] = 100
         proxy["new_field"] = "baz"
@@ -224,6 +303,69 @@ class TestAccessProxy:
         assert proxy["int_field"] == 100
         assert proxy["new_field"] == "baz"
 
+    def test_private_attribute_probe(self, proxy):
+        assert not hasattr(proxy, "_ipython_canary_method_should_not_exist_")
+        assert not hasattr(proxy, "__len__")
+
+        shallow = copy(proxy)
+        assert shallow._data is proxy._data
+        assert shallow.int_field == 42
+
+    def test_private_field(self):
+        @dataclass
+        class PrivateConfig:
+            _p: int = 1
+
+        config = ConfigExtra(PrivateConfig())
+        assert config.data._p == 1
+        assert config.proxy["_p"] == 1
+        assert config.to_dict() == {"_p": 1}
+
+        config.proxy._p = 2
+        assert config.schema_data._p == 2
+        config.proxy._q = 3
+        assert config.proxy._q == 3
+        assert config.extra_data == {"_q": 3}
+
+    def test_private_attributes(self):
+        @dataclass
+        class PrivateConfig(Config42):
+            def _helper(self) -> int:
+                return self.int_field + 1
+
+            @property
+            def _computed(self) -> int:
+                return self.int_field * 2
+
+        proxy = AccessProxy(PrivateConfig(), {})
+        assert proxy._helper() == 43
+        assert proxy._computed == 84
+
+    def test_item_access_missing_and_property(self):
+        @dataclass
+        class PropertyConfig(Config42):
+            @property
+            def doubled(self) -> int:
+                return self.int_field * 2
+
+            @doubled.setter
+            def doubled(self, value: int) -> None:
+                self.int_field = value // 2
+
+        proxy = AccessProxy(PropertyConfig(), {})
+        assert proxy["doubled"] == 84
+        with pytest.raises(KeyError):
+            proxy["unknown"]
+
+        proxy["unknown"] = "Known"
+        assert proxy["unknown"] == "Known"
+        assert proxy._extra_data == {"unknown": "Known"}
+
+        proxy["doubled"] = 70
+        assert proxy["doubled"] == proxy.doubled == 70
+        assert proxy.int_field == 35
+        assert proxy._extra_data == {"unknown": "Known"}
+
     def test_item_assignment_nested(self, proxy):
         proxy["nested"] = {}
         proxy["nested"]["level"] = 42
@@ -281,6 +423,19 @@ class TestAccessProxy:
         assert proxy_2 == proxy
         assert proxy_2._to_dict() == proxy._to_dict()
 
+    def test_deepcopy_extra_data(self):
+        extra_data: dict[str, Any] = dict(foo="bar", nested={"list": [1, 2]})
+        proxy = AccessProxy(
+            Config42(),
+            extra_data,
+        )
+
+        proxy_2 = deepcopy(proxy)
+        assert proxy_2._extra_data == extra_data
+        assert proxy_2._extra_data is not extra_data
+        assert proxy_2._extra_data["nested"] is not extra_data["nested"]
+        assert proxy_2._extra_data["nested"]["list"] is not extra_data["nested"]["list"]
+
     def test_hash(self):
         config_data = Config42()
         extra_data: dict[str, Any] = dict(list_for_hash=[1, 2, 3])
@@ -309,3 +464,18 @@ class TestReset:
 
         assert conf42.data.int_field == 42
         assert conf42.data.str_field == "FortyTwo!"
+
+
+class TestOverwrite:
+    def test_proxy_follows_data(self, conf42: ConfigExtra[Config42]):
+        proxy = conf42.proxy
+        conf42.overwrite({"int_field": 7, "str_field": "Seven"})
+
+        assert conf42.proxy is not proxy
+        assert conf42.proxy._data is conf42.schema_data
+        assert conf42.data.int_field == 7
+
+        # Overwriting with the current data keeps the proxy
+        proxy = conf42.proxy
+        conf42.overwrite(conf42.schema_data)
+        assert conf42.proxy is proxy
@@ -4,6 +4,7 @@ import os
 from pathlib import Path
 
 import pytest
+import yaml
 
 from eyconf import EYConf
 
@@ -54,6 +55,22 @@ class TestEYConfFile:
             conf._write_default()
             assert "overwriting" in caplog.text.lower()
 
+    def test_relative_get_file(self, tmp_path, monkeypatch):
+        class RelativeEYConf(EYConf):
+            @staticmethod
+            def get_file() -> Path:
+                return Path("relative.yml")
+
+        monkeypatch.chdir(tmp_path)
+        conf = RelativeEYConf(Config42)
+        # Kept as returned, only displayed as absolute path
+        assert conf.path == Path("relative.yml")
+        assert f"loaded from {tmp_path / 'relative.yml'}>" in repr(conf)
+
+    def test_default_yaml_cached(self, tmp_config_path):
+        conf = EYConf(Config42)
+        assert conf.default_yaml() is EYConf(Config42).default_yaml()
+
     def test_load_existing(self, tmp_config_path):
         with open(tmp_config_path, "w") as f:
             f.write("int_field: 20\nstr_field: Another value!\n")
@@ -61,6 +78,26 @@ class TestEYConfFile:
         assert conf._data.int_field == 20
         assert conf._data.str_field == "Another value!"
 
+    def test_load_json(self, tmp_path):
+        json_path = tmp_path / "config.json"
+        os.environ["EYCONF_CONFIG_FILE"] = str(json_path)
+
+        # Defaults are generated as yaml
+        conf = EYConf(Config42)
+        assert conf._data == Config42()
+
+        json_path.write_text('{"int_field": 20}')
+        conf.reload()
+        assert conf._data.int_field == 20
+        assert conf._data.str_field == "FortyTwo!"
+
+    def test_load_invalid_yaml(self, tmp_config_path):
+        conf = EYConf(Config42)
+        tmp_config_path.write_text("int_field: [1\nstr_field: foo\n")
+
+        with pytest.raises(yaml.YAMLError, match=str(tmp_config_path)):
+            conf.reload()
+
     def test_reload(self, tmp_config_path):
         with open(tmp_config_path, "w") as f:
             f.write("int_field: 10\nstr_field: Temp value!\n")
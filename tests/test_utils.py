@@ -1,8 +1,14 @@
+import gc
+import weakref
 from collections.abc import Sequence
+from enum import Enum
+from pathlib import Path
 from typing import Annotated
 import pytest
 from eyconf.decorators import DictAccess, dict_access
 from eyconf.type_utils import (
+    _get_type_hints_cached,
+    get_type_hints_resolve_namespace,
     iter_dataclass_type,
 )
 from dataclasses import dataclass, field
@@ -12,7 +18,7 @@ from eyconf.asdict import asdict_with_aliases
 # for some reason typing  Sequence and abc sequence are not the same type
 from typing import Sequence as TypingSequence  # noqa: UP035
 
-from eyconf.utils import merge_dicts  # noqa: UP035
+from eyconf.utils import dataclass_from_dict, merge_dicts  # noqa: UP035
 
 
 @dict_access
@@ -85,6 +91,71 @@ class TestAsDict:
         )
         assert set(dump.keys()) == expected_keys
 
+    def test_asdict_slots(self):
+        @dataclass(slots=True)
+        class SlotsConfig:
+            int_field: int = 42
+            nested: Nested = field(default_factory=Nested)
+
+        dump = asdict_with_aliases(SlotsConfig(), include_attributes=True)
+        assert dump == {"int_field": 42, "nested": {"str_field": "FortyTwo"}}
+
+    def test_asdict_nested_attributes(self):
+        """Flags are only passed on below dataclasses with aliases."""
+
+        @dataclass
+        class Plain:
+            nested: Nested = field(default_factory=Nested)
+
+        @dataclass
+        class Aliased:
+            nested: Nested = field(default_factory=Nested, metadata={"alias": "n"})
+
+        plain = Plain()
+        plain.nested.dyn = "x"  # type: ignore[attr-defined]
+        dump = asdict_with_aliases(plain, include_attributes=True)
+        assert dump == {"nested": {"str_field": "FortyTwo"}}
+
+        aliased = Aliased()
+        aliased.nested.dyn = "x"  # type: ignore[attr-defined]
+        dump = asdict_with_aliases(aliased, include_attributes=True)
+        assert dump == {"n": {"str_field": "FortyTwo", "dyn": "x"}}
+
+    def test_dynamic_schemas_released(self):
+        """The per-type caches are bounded, dynamic schemas are not kept alive."""
+
+        def make_schema() -> weakref.ref:
+            @dataclass
+            class Dynamic:
+                int_field: int = 42
+
+            asdict_with_aliases(Dynamic())
+            dataclass_from_dict(Dynamic, {"int_field": 1})
+            return weakref.ref(Dynamic)
+
+        ref = make_schema()
+        for _ in range(300):
+            make_schema()
+        gc.collect()
+        assert ref() is None
+
+    def test_asdict_immutable_values(self):
+        class Color(Enum):
+            RED = "red"
+
+        @dataclass
+        class ConfigWithImmutables:
+            path: Path = Path("/tmp")
+            color: Color = Color.RED
+            mutable: list[list[int]] = field(default_factory=lambda: [[1]])
+
+        config = ConfigWithImmutables()
+        dump = asdict_with_aliases(config)
+        assert dump["path"] is config.path
+        assert dump["color"] is config.color
+        assert dump["mutable"] == config.mutable
+        assert dump["mutable"][0] is not config.mutable[0]
+
 
 @dataclass
 class Item:
@@ -216,6 +287,120 @@ class TestIterDataclassType:
         assert Inner in result
 
 
+class TestGetTypeHints:
+    def test_cached(self):
+        hints = get_type_hints_resolve_namespace(Config42)
+        assert hints == {"int_field": int, "nested": Nested}
+
+        # Mutating the result does not affect the cache
+        hints["int_field"] = str
+        assert get_type_hints_resolve_namespace(Config42)["int_field"] is int
+
+    def test_bound_method(self):
+        hints = get_type_hints_resolve_namespace(Config42().__init__)  # type: ignore[misc]
+        assert hints == get_type_hints_resolve_namespace(Config42.__init__)
+        assert hints["nested"] is Nested
+
+    def test_unhashable_instance(self):
+        # eq=True dataclasses set __hash__ to None
+        hints = get_type_hints_resolve_namespace(Config42())
+        assert hints == {"int_field": int, "nested": Nested}
+
+    def test_instance_cached_per_type(self):
+        @dataclass(frozen=True)
+        class Frozen:
+            value: int
+
+        hints = get_type_hints_resolve_namespace(Frozen(1))
+        size = _get_type_hints_cached.cache_info().currsize
+        assert get_type_hints_resolve_namespace(Frozen(2)) == hints == {"value": int}
+        assert _get_type_hints_cached.cache_info().currsize == size
+
+
+@dataclass
+class FromDictConfig:
+    required: int
+    aliased: str = field(default="a", metadata={"alias": "aliased-key"})
+    nested: Nested = field(default_factory=Nested)
+    items: list[Nested] = field(default_factory=list)
+    optional: Nested | None = None
+
+
+class TestDataclassFromDict:
+    def test_nested(self):
+        result = dataclass_from_dict(
+            FromDictConfig,
+            {
+                "required": 1,
+                "nested": {"str_field": "a"},
+                "items": [{"str_field": "b"}],
+                "optional": {"str_field": "c"},
+            },
+        )
+        assert result == FromDictConfig(
+            required=1,
+            nested=Nested("a"),
+            items=[Nested("b")],
+            optional=Nested("c"),
+        )
+
+    def test_generic_containers(self):
+        @dataclass
+        class Containers:
+            mapping: dict[str, list[Nested]] = field(default_factory=dict)
+            untyped: list = field(default_factory=list)
+            union: list[Nested] | None = None
+
+        result = dataclass_from_dict(
+            Containers,
+            {
+                "mapping": {"a": [{"str_field": "b"}]},
+                "untyped": [{"str_field": "c"}],
+                "union": [{"str_field": "d"}],
+            },
+        )
+        assert result.mapping == {"a": [Nested("b")]}
+        assert result.untyped == [{"str_field": "c"}]
+        assert result.union == [Nested("d")]
+
+    def test_alias(self):
+        result = dataclass_from_dict(
+            FromDictConfig, {"required": 1, "aliased-key": "b"}
+        )
+        assert result.aliased == "b"
+        result = dataclass_from_dict(FromDictConfig, {"required": 1, "aliased": "c"})
+        assert result.aliased == "c"
+
+    def test_alias_and_name(self):
+        @dataclass
+        class Required:
+            value: int
+
+        @dataclass
+        class AliasedNested:
+            inner: Required = field(
+                default_factory=lambda: Required(0), metadata={"alias": "in"}
+            )
+
+        # The alias wins regardless of the key order, the
+        # (invalid) value of the field name is not converted
+        for data in (
+            {"in": {"value": 1}, "inner": {}},
+            {"inner": {}, "in": {"value": 1}},
+        ):
+            assert dataclass_from_dict(AliasedNested, data).inner == Required(1)
+
+    def test_additional(self, caplog):
+        with caplog.at_level("INFO"):
+            result = dataclass_from_dict(FromDictConfig, {"required": 1, "unknown": 2})
+        assert result == FromDictConfig(required=1)
+        assert "['unknown']" in caplog.text
+
+    def test_missing_required(self):
+        with pytest.raises(ValueError, match="Failed to create FromDictConfig"):
+            dataclass_from_dict(FromDictConfig, {"aliased": "b"})
+
+
 class TestMergeDicts:
     def test_merge_simple_dicts(self):
         """Test merging two simple dictionaries without conflicts."""
@@ -288,3 +473,15 @@ class TestMergeDicts:
         b = {"key": "value2"}
         result = merge_dicts(a, b, priority="b")
         assert result == {"key": "value2"}
+
+    def test_merge_copy(self):
+        """Test that values of b are not shared with the result if copy is set."""
+        a = {"nested": {"key": "value"}}
+        b: dict = {"nested": {"list": [1, 2]}, "other": {"key": "value"}}
+        result = merge_dicts(a, b, copy=True)
+        assert result == {
+            "nested": {"key": "value", "list": [1, 2]},
+            "other": {"key": "value"},
+        }
+        assert result["nested"]["list"] is not b["nested"]["list"]
+        assert result["other"] is not b["other"]
@@ -61,6 +61,10 @@ class TestGetValidator:
         v = get_validator("jsonschema", allow_additional=True)
         assert v.allow_additional is True  # type: ignore[attr-defined]
 
+    def test_allow_additional_is_forwarded_default(self) -> None:
+        v = get_validator(None, allow_additional=True)
+        assert v.allow_additional is True  # type: ignore[attr-defined]
+
     def test_allow_additional_defaults_to_false(self) -> None:
         v = get_validator("pydantic")
         assert v.allow_additional is False  # type: ignore[attr-defined]
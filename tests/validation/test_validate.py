@@ -7,6 +7,7 @@ registered in the fixture and the test suite covers it automatically.
 
 from __future__ import annotations
 
+from copy import deepcopy
 from dataclasses import dataclass
 from typing import is_typeddict
 
@@ -41,6 +42,7 @@ from .conftest import (
     NotRequiredDict,
     OptionalSchema,
     PrimitiveSchema,
+    PrimitiveSchemaWithDefaults,
     SchemaAny,
     SchemaLiteralUnion,
     SchemaNone,
@@ -421,6 +423,19 @@ class TestToJsonSchema:
 
         assert schema is schema2
 
+    def test_cache_shared_between_instances(self, validator):
+        other = type(validator)(allow_additional=validator.allow_additional)
+        assert other.to_json_schema(PrimitiveSchema) is validator.to_json_schema(
+            PrimitiveSchema
+        )
+
+    def test_validate_keeps_cached_schema(self, validator):
+        schema = deepcopy(validator.to_json_schema(PrimitiveSchemaWithDefaults))
+        validator.validate(PrimitiveSchemaWithDefaults(), PrimitiveSchemaWithDefaults)
+        validator.validate(PrimitiveSchemaWithDefaults(), PrimitiveSchemaWithDefaults)
+
+        assert validator.to_json_schema(PrimitiveSchemaWithDefaults) == schema
+
     # ------------------------------------------------------------------ #
     # Dict key type validation
     # ------------------------------------------------------------------ #